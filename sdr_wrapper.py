@@ -1,4 +1,4 @@
-from typing import Final, Union
+from typing import Final, Optional, Union
 
 import numpy as np
 import rtlsdr
@@ -15,8 +15,8 @@ def parse_gain(gain_str: str) -> Gain:
         return gain_str
     try:
         return float(gain_str)
-    except TypeError as err:
-        raise TypeError(f"Invalid gain string: {gain_str!r}") from err
+    except (TypeError, ValueError) as err:
+        raise ValueError(f"Invalid gain string: {gain_str!r}") from err
 
 
 class MockRtlSdr:
@@ -24,21 +24,39 @@ class MockRtlSdr:
     Mock version of an rtlsdr.RtlSdr device. This is used when no SDR device
     is connected so that we can still run and test the code. It has the same
     interface as `rtlsdr.RtlSdr`, except that its `read_samples()` method
-    generates complex-valued Gaussian noise.
+    generates complex-valued Gaussian noise. Like the real device, the noise
+    is quantised to 8-bit I/Q values, which saturate at full scale, and
+    returned as single precision (complex64) samples in [-1, 1].
     """
 
     MAX_READ_SAMPLES: Final[int] = 2**24
 
+    # Half the range of the 8-bit ADC, i.e. the full scale in ADC units
+    _ADC_HALF_RANGE: Final[float] = 127.5
+
     def __init__(self) -> None:
         # Define all members of RtlSdr that are exposed to the user
         self.sample_rate = 2.048e6  # Hz
         self.center_freq = 1420.4e6  # Hz
         self.gain = 1.0
 
+        # SFC64 is one of the fastest bit generators in numpy, which matters
+        # here because generating the noise dominates read_samples()
+        self._rng = np.random.Generator(np.random.SFC64())
+
+        # Scratch buffer for the returned samples, reused across calls to
+        # read_samples() and grown lazily
+        self._scratch: Optional[NDArray[np.complex64]] = None
+
     def close(self) -> None:
         pass
 
-    def read_samples(self, num_samples: Union[int, float]) -> NDArray[np.complex128]:
+    def read_samples(self, num_samples: Union[int, float]) -> NDArray[np.complex64]:
+        """
+        Return `num_samples` complex64 noise samples. The returned array is a
+        view into an internal buffer: it is overwritten by the next call, so
+        copy it if it must outlive that call.
+        """
         n = int(num_samples)
         if not n > 0:
             raise ValueError(f"Number of samples to read must be > 0")
@@ -51,15 +69,43 @@ class MockRtlSdr:
 
         # NOTE: scale is empirically adjusted so that the procedure of finding
         # the optimum gain takes a few trials
-        scale = 0.01 * self.get_gain()
-        real = np.random.normal(size=n, scale=scale)
-        imag = np.random.normal(size=n, scale=scale)
-        return real + 1.0j * imag
+        scale = 0.01 * self._gain_f
+
+        if self._scratch is None or self._scratch.size < n:
+            self._scratch = np.empty(n, dtype=np.complex64)
+        samples = self._scratch[:n]
+
+        # Draw Gaussian I/Q values directly into the interleaved float view of
+        # the samples, to avoid building `real + 1j * imag`, and express them
+        # in ADC units relative to mid-scale
+        iq = samples.view(np.float32)
+        self._rng.standard_normal(dtype=np.float32, out=iq)
+        iq *= np.float32(self._ADC_HALF_RANGE * scale)
+
+        # Quantise them like the 8-bit ADC: 256 levels centred on zero, with
+        # values beyond full scale clipped to the extreme codes. As in
+        # pyrtlsdr, the codes are then mapped to [-1, 1].
+        np.floor(iq, out=iq)
+        np.clip(iq, -128.0, 127.0, out=iq)
+        iq += np.float32(0.5)
+        iq /= np.float32(self._ADC_HALF_RANGE)
+        return samples
+
+    @property
+    def gain(self) -> Gain:
+        return self._gain_raw
+
+    @gain.setter
+    def gain(self, value: Gain) -> None:
+        # Numerical value of the gain, cached so that read_samples() does not
+        # have to check for "auto" (which behaves like unity gain) every time.
+        # Convert it first, so that an invalid value leaves the gain unchanged.
+        gain_f = 1.0 if value == "auto" else float(value)
+        self._gain_raw = value
+        self._gain_f = gain_f
 
     def get_gain(self) -> float:
-        if self.gain == "auto":
-            return 1.0
-        return self.gain
+        return self._gain_f
 
 
 SdrDevice = Union[MockRtlSdr, rtlsdr.RtlSdr]
@@ -1,25 +1,28 @@
 import argparse
+import concurrent.futures
+import os
+import queue
+import tempfile
+import threading
 import tkinter as tk
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-import numpy as np
-import rtlsdr
-from matplotlib.backends.backend_tkagg import (
-    FigureCanvasTkAgg,
-    NavigationToolbar2Tk,
-)
-from matplotlib.figure import Figure
-from numpy.typing import NDArray
-from PIL import Image, ImageTk
-
-from gain_search import find_optimal_gain
-from plotting import plot_power_spectrum_on_axes
-from record_data import record_power_spectrum
-from sdr_wrapper import MockRtlSdr
+# NOTE: heavy modules (numpy, matplotlib, PIL, rtlsdr, ...) are imported in the
+# methods that use them, so that e.g. `--help` returns without loading them
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 
 class TabletopApp:
+    # Interval at which the progress of the gain search is polled, in ms
+    GAIN_SEARCH_POLL_INTERVAL_MS = 50
+
     def __init__(self, root: tk.Tk, mock_device: bool = False) -> None:
+        import rtlsdr
+
+        from sdr_wrapper import MockRtlSdr
+
         # The SDR device lass to use
         self._sdr_class = MockRtlSdr if mock_device else rtlsdr.RtlSdr
 
@@ -27,12 +30,36 @@ class TabletopApp:
         self._optimal_gain: Optional[float] = None
 
         # Baseline power spectrum recorded during the preparation step
-        self._baseline_power_spectrum: Optional[NDArray] = None
+        self._baseline_power_spectrum: Optional["NDArray"] = None
+
+        # Reciprocal of the baseline, so that observations are normalised
+        # with a multiplication. Zero baseline bins map to 0.
+        self._inv_baseline_power_spectrum: Optional["NDArray"] = None
+
+        # The gain search runs on this worker thread, so that the GUI stays
+        # responsive; see prepare(). The worker never touches Tk: it pushes
+        # the gains it tries onto a queue that the main thread polls.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._gain_search: Optional[concurrent.futures.Future] = None
+        self._gain_search_progress: queue.Queue = queue.Queue()
+
+        # True from prepare() until _prepare_done() has finished, including
+        # the wait for the next poll after the gain search has completed
+        self._preparing = False
+
+        # Set when the window is destroyed, to abort a running gain search
+        self._closing = threading.Event()
 
         self.root = root
         self.init_gui()
 
     def init_gui(self):
+        from matplotlib.backends.backend_tkagg import (
+            FigureCanvasTkAgg,
+            NavigationToolbar2Tk,
+        )
+        from matplotlib.figure import Figure
+
         self.root.title("SKAO Table-top Radio Telescope (TRT) App")
 
         # Load and display SKAO logo bar at the top
@@ -52,6 +79,15 @@ class TabletopApp:
         self.toolbar.update()
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
 
+        # Text screens are drawn as animated artists blitted over a cached
+        # bitmap of the figure without text, which is (re)captured on every
+        # full draw of the canvas, e.g. after a window resize. The artists are
+        # kept by key ("title", "line0", ...) and reused between screens.
+        self._text_mode = False
+        self._text_artists: dict = {}
+        self._text_background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
         # Can call clear_figure(), now that canvas exists
         self.clear_figure()
         self.canvas.draw()
@@ -59,9 +95,10 @@ class TabletopApp:
         # Create Status Bar
         font = ("Helvetica", 10)
 
+        self._status_var = tk.StringVar(master=self.root, value="Status: Ready")
         self.status_bar = tk.Label(
             self.root,
-            text="Status: Ready",
+            textvariable=self._status_var,
             relief=tk.SUNKEN,
             anchor=tk.W,
             height=2,
@@ -103,12 +140,14 @@ class TabletopApp:
         self.button_exit = tk.Button(
             self.root,
             text="Exit",
-            command=root.destroy,
+            command=self.destroy,
             width=button_width,
             font=font,
         )
         self.button_exit.pack(side=tk.LEFT, padx=padx)
 
+        self.root.protocol("WM_DELETE_WINDOW", self.destroy)
+
         self.show_text_on_figure(
             [
                 "Short instruction manual:",
@@ -119,22 +158,74 @@ class TabletopApp:
         )
 
     def load_and_display_image(self, image_path: str):
-        original_image = Image.open(image_path)
-        resized_image = original_image.resize((1200, 140))
+        """
+        Display the image resized to the logo bar size. The resized copy is
+        cached in a per-user cache directory, keyed by the source file's
+        modification time, so that later launches skip the resampling.
+        """
+        from PIL import Image, ImageTk
+
+        size = (1200, 140)
+        source = Path(image_path)
+        cache_dir = get_cache_dir()
+        cache_prefix = f"{source.stem}_{size[0]}x{size[1]}_"
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = cache_dir / f"{cache_prefix}{source.stat().st_mtime_ns}.png"
+
+        resized_image = None
+        if cache_path is not None and cache_path.exists():
+            try:
+                resized_image = Image.open(cache_path)
+                resized_image.load()
+            except OSError:
+                # Unreadable cache file (e.g. truncated), regenerate it
+                resized_image = None
+
+        if resized_image is None:
+            resized_image = Image.open(source).resize(
+                size, resample=Image.Resampling.BILINEAR
+            )
+            if cache_path is not None:
+                save_image_atomically(resized_image, cache_path)
+                # Remove copies made from older versions of the source
+                for stale_path in cache_dir.glob(f"{cache_prefix}*.png"):
+                    if stale_path != cache_path:
+                        stale_path.unlink(missing_ok=True)
+
         tk_image = ImageTk.PhotoImage(resized_image)
         image_label = tk.Label(self.root, image=tk_image, background="white")
         image_label.image = tk_image
         image_label.pack(side=tk.TOP, fill=tk.BOTH, expand=1)
 
-    def clear_figure(self):
+    def _clear_axes_no_draw(self):
         self.ax.clear()
         self.ax.axis("off")
-        self.canvas.draw()
-        # "Goofy way" to make sure the screen updates
-        # https://stackoverflow.com/a/16700254
-        self.root.update_idletasks()
+        self._text_artists = {}
+
+    def _on_draw(self, event):
+        if not self._text_mode:
+            self._text_background = None
+            return
+        self._text_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        # Animated artists are skipped by a full draw, render them on top
+        for artist in self._text_artists.values():
+            self.ax.draw_artist(artist)
+
+    def clear_figure(self):
+        self._clear_axes_no_draw()
+        self._text_mode = True
+        # NOTE: no update_idletasks() here, none of the callers block the
+        # event loop next, so the draw is coalesced with any that follow
+        self.canvas.draw_idle()
 
     def prepare(self):
+        from gain_search import find_optimal_gain
+
+        if self._preparing:
+            self.update_status("Preparation already in progress ...")
+            return
+
         self.show_text_on_figure(
             [
                 "This step calibrates your RF device",
@@ -145,53 +236,106 @@ class TabletopApp:
 
         self.update_status("Finding optimal gain ...")
 
+        self._gain_search = self._executor.submit(
+            find_optimal_gain,
+            self._sdr_class,
+            callback=self._on_gain_search_progress,
+        )
+        self._preparing = True
+        self.root.after(self.GAIN_SEARCH_POLL_INTERVAL_MS, self._poll_gain_search)
+
+    def _on_gain_search_progress(self, gain: float):
+        """
+        Callback of the gain search, called on the worker thread.
+        """
+        if self._closing.is_set():
+            # Abort the search, the window is gone
+            raise concurrent.futures.CancelledError()
+        self._gain_search_progress.put(gain)
+
+    def _poll_gain_search(self):
+        """
+        Show the progress of the gain search, and finish the preparation step
+        once it is done. Runs on the main thread, via root.after().
+        """
+        # Check first, so that all progress of a finished search is drained
+        done = self._gain_search.done()
+
+        # Only the latest gain is shown, older ones are already stale
+        gain = None
+        while not self._gain_search_progress.empty():
+            gain = self._gain_search_progress.get_nowait()
+        if gain is not None:
+            self.update_status(f"Finding optimal gain ... trying gain = {gain:.2f}")
+
+        if done:
+            self._prepare_done()
+        else:
+            self.root.after(self.GAIN_SEARCH_POLL_INTERVAL_MS, self._poll_gain_search)
+
+    def _prepare_done(self):
+        """
+        Second half of the preparation step, run on the main thread once the
+        gain search has finished.
+        """
+        import numpy as np
+
+        from record_data import record_power_spectrum
+
         try:
-            self._optimal_gain = find_optimal_gain(
-                self._sdr_class,
-                callback=lambda gain: self.update_status(
-                    f"Finding optimal gain ... trying gain = {gain:.2f}"
-                ),
+            try:
+                self._optimal_gain = self._gain_search.result()
+            except Exception as err:
+                self.update_status(f"Preparation failed: {err!s}")
+                return
+
+            self.show_text_on_figure(
+                [
+                    "This step calibrates your RF device",
+                    "Searching for optimal gain ... DONE.",
+                    "Recording baseline power spectrum ...",
+                ],
+                title="Preparation in progress",
             )
-        except Exception as err:
-            self.update_status(f"Preparation failed: {err!s}")
-            return
-
-        self.show_text_on_figure(
-            [
-                "This step calibrates your RF device",
-                "Searching for optimal gain ... DONE.",
-                "Recording baseline power spectrum ...",
-            ],
-            title="Preparation in progress",
-        )
 
-        # Record baseline integrated power spectrum
-        # using optimal gain setting
-        self.update_status(
-            f"Optimal gain found ({self._optimal_gain:.2f}), "
-            "recording baseline power spectrum ..."
-        )
-        __, self._baseline_power_spectrum = record_power_spectrum(
-            self._sdr_class, self._optimal_gain
-        )
+            # Record baseline integrated power spectrum
+            # using optimal gain setting
+            self.update_status(
+                f"Optimal gain found ({self._optimal_gain:.2f}), "
+                "recording baseline power spectrum ..."
+            )
+            __, self._baseline_power_spectrum = record_power_spectrum(
+                self._sdr_class, self._optimal_gain
+            )
+            baseline = self._baseline_power_spectrum
+            self._inv_baseline_power_spectrum = np.divide(
+                1.0, baseline, out=np.zeros_like(baseline), where=baseline > 0
+            )
 
-        self.update_status("Preparation complete!")
-        self.show_text_on_figure(
-            [
-                f"Optimum Gain = {self._optimal_gain:.2f}",
-                "You can observe the Milky Way!",
-                "Remove RF termination and",
-                "Connect your antenna to the Sawbird HI",
-            ],
-            title="Preparation complete",
-        )
+            self.update_status("Preparation complete!")
+            self.show_text_on_figure(
+                [
+                    f"Optimum Gain = {self._optimal_gain:.2f}",
+                    "You can observe the Milky Way!",
+                    "Remove RF termination and",
+                    "Connect your antenna to the Sawbird HI",
+                ],
+                title="Preparation complete",
+            )
+        finally:
+            self._preparing = False
 
     def show_text_on_figure(self, lines: list[str], title: str = ""):
         """
         Display given lines of text on the plotting area. Title is shown at
         the top, in bold and in a different color.
         """
-        self.clear_figure()
+        # A full redraw is only needed when coming from a plot, otherwise the
+        # new text is blitted over the cached background
+        full_draw = not self._text_mode or self._text_background is None
+        if not self._text_mode:
+            self._clear_axes_no_draw()
+            self._text_mode = True
 
         SKAO_BLUE = "#070068"
         SKAO_MAGENTA = "#E50869"
@@ -201,19 +345,55 @@ class TabletopApp:
         y = 0.70
         ystep = 0.1
 
-        self.ax.text(
-            x, y, title, fontsize=fontsize, fontweight="bold", color=SKAO_MAGENTA
-        )
-        y -= ystep
-
-        for line in lines:
-            self.ax.text(x, y, line, fontsize=fontsize, color=SKAO_BLUE)
+        texts = {"title": title}
+        texts.update((f"line{i}", line) for i, line in enumerate(lines))
+
+        # Blank out lines left over from a longer previous screen
+        for key, artist in self._text_artists.items():
+            if key not in texts:
+                artist.set_text("")
+
+        for key, text in texts.items():
+            if key in self._text_artists:
+                self._text_artists[key].set_text(text)
+            elif key == "title":
+                self._text_artists[key] = self.ax.text(
+                    x,
+                    y,
+                    text,
+                    fontsize=fontsize,
+                    fontweight="bold",
+                    color=SKAO_MAGENTA,
+                    animated=True,
+                )
+            else:
+                self._text_artists[key] = self.ax.text(
+                    x, y, text, fontsize=fontsize, color=SKAO_BLUE, animated=True
+                )
             y -= ystep
 
-        self.canvas.draw()
+        if full_draw:
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._text_background)
+            for artist in self._text_artists.values():
+                self.ax.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
+
+        # Flush the screen update now, callers may block the event loop after
+        self.root.update_idletasks()
 
     def sky_obs(self):
-        if self._baseline_power_spectrum is None or self._optimal_gain is None:
+        import numpy as np
+
+        from plotting import plot_power_spectrum_on_axes
+        from record_data import record_power_spectrum
+
+        if self._preparing:
+            self.update_status("Please wait for the preparation step to finish!")
+            return
+
+        if self._inv_baseline_power_spectrum is None or self._optimal_gain is None:
             self.update_status("Please run the preparation step first!")
             return
 
@@ -238,27 +418,73 @@ class TabletopApp:
             return
 
         # Normalise by baseline power spectrum
-        HIspectrum = power_spectrum / self._baseline_power_spectrum
-        HIspectrum = HIspectrum - np.min(HIspectrum)
-        HIspectrum = HIspectrum / np.max(HIspectrum)
+        # NOTE: rescale to [0, 1] in place to avoid extra temporary arrays
+        HIspectrum = np.multiply(power_spectrum, self._inv_baseline_power_spectrum)
+        lo = HIspectrum.min()
+        hi = HIspectrum.max()
+        np.subtract(HIspectrum, lo, out=HIspectrum)
+        np.multiply(HIspectrum, 1.0 / (hi - lo), out=HIspectrum)
 
         self.update_status("Observation finished!")
 
         # Plot result
-        self.clear_figure()
+        self._clear_axes_no_draw()
+        self._text_mode = False
         plot_power_spectrum_on_axes(self.ax, freq_hz, HIspectrum)
         self.ax.axis("on")  # don't forget to turn axes back on
         self.ax.set_title("Hydrogen Line (HI) signal of the Milky Way", fontsize=16)
-        self.ax.set_ylim(np.min(HIspectrum), 1.01)
+        self.ax.set_ylim(0.0, 1.01)  # minimum is 0 after normalisation
         self.fig.tight_layout()
         self.canvas.draw()
 
     def update_status(self, message: str):
-        self.status_bar.config(text="Status: " + message)
+        self._status_var.set("Status: " + message)
         # "Goofy way" to make sure the status bar updates
         # https://stackoverflow.com/a/16700254
         self.root.update_idletasks()
 
+    def destroy(self):
+        """
+        Close the app. A running gain search is aborted at its next step, and
+        a pending one is cancelled.
+        """
+        self._closing.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Return the app's per-user cache directory, creating it (accessible to the
+    user only) if needed, or None if that is not possible.
+    """
+    try:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(base_dir) / "skao_trt"
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except (OSError, RuntimeError):  # RuntimeError: home directory unknown
+        return None
+    return cache_dir
+
+
+def save_image_atomically(image, path: Path):
+    """
+    Save a PIL image as PNG to `path`, going through a temporary file in the
+    same directory, so that other processes never see a partially written
+    file. Failures are ignored, as this is only used for caching.
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".png.tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            image.save(tmp_file, format="PNG")
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(